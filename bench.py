@@ -0,0 +1,58 @@
+'''
+
+Benchmark de generadores y solvers en grids grandes (sin Tk)
+
+Creado por Fabián Hevia
+
+'''
+
+import argparse
+import time
+import tracemalloc
+
+from grid import Grid, parse_cell
+from connectivity import Connectivity
+import deadend
+
+
+def measure(label: str, fn, cells: int, memory: bool) -> None:
+    if memory:
+        tracemalloc.start()
+    t0 = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - t0
+
+    line = f"{label:<14} {elapsed:9.3f} s"
+    if memory:
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        line += f"   pico {peak / 2**20:9.1f} MiB ({peak / cells:5.1f} B/celda)"
+    print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mide generación y búsqueda en un grid rows x cols.")
+    parser.add_argument("rows", type=int)
+    parser.add_argument("cols", type=int)
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--start", type=parse_cell, default=None, help="celda inicial r,c")
+    parser.add_argument("--goal", type=parse_cell, default=None, help="celda meta r,c")
+    parser.add_argument("--braid", type=float, default=0.0, help="fracción de callejones a eliminar")
+    parser.add_argument("--memory", action="store_true", help="medir pico de memoria (más lento)")
+    args = parser.parse_args()
+
+    grid = Grid(args.rows, args.cols, start=args.start, goal=args.goal)
+    cells = args.rows * args.cols
+    print(f"Grid {args.rows}x{args.cols} ({cells} celdas), start={grid.start} goal={grid.goal}")
+
+    measure("generar", lambda: grid.recursive_backtracker(seed=args.seed), cells, args.memory)
+    if args.braid > 0:
+        measure("braid", lambda: grid.braid(args.braid, seed=args.seed), cells, args.memory)
+    measure("union-find", lambda: Connectivity(grid), cells, args.memory)
+    measure("bfs", lambda: grid.bfs(grid.start, grid.goal), cells, args.memory)
+    measure("jps", lambda: grid.jps(grid.start, grid.goal), cells, args.memory)
+    measure("dead-end fill", lambda: deadend.solve(grid), cells, args.memory)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+'''
+
+Conectividad del grid con union-find sobre arreglos
+
+Creado por Fabián Hevia
+
+'''
+
+from array import array
+from typing import List
+
+from grid import Grid, Cell, WALL_DOWN, WALL_RIGHT
+
+
+class Connectivity:
+    """
+    Union-find (path halving + unión por tamaño) sobre los índices r * cols + c,
+    con dos arrays de 4 bytes por celda.
+
+    Cada muro removido une las dos celdas, así que responder si dos celdas
+    son alcanzables, cuántas componentes hay o el tamaño de una componente
+    cuesta O(α(n)) sin recorrer el grid. Solo se soporta quitar muros, que
+    es lo único que hacen los generadores.
+    """
+
+    def __init__(self, grid: Grid):
+        self.cols = grid.cols
+        total = grid.rows * grid.cols
+
+        self.parent = array("i", range(total))
+        self.size = array("i", [1]) * total
+        self.count = total
+
+        # Unir según los muros ya abiertos (basta mirar derecha y abajo)
+        cols = self.cols
+        for i, m in enumerate(grid.walls):
+            if not m & WALL_RIGHT:
+                self.union_index(i, i + 1)
+            if not m & WALL_DOWN:
+                self.union_index(i, i + cols)
+
+    def find(self, i: int) -> int:
+        parent = self.parent
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    def union_index(self, i: int, j: int) -> bool:
+        """Une las componentes de los índices i y j. Retorna True si eran distintas."""
+        ri, rj = self.find(i), self.find(j)
+        if ri == rj:
+            return False
+        if self.size[ri] < self.size[rj]:
+            ri, rj = rj, ri
+        self.parent[rj] = ri
+        self.size[ri] += self.size[rj]
+        self.count -= 1
+        return True
+
+    def union(self, a: Cell, b: Cell) -> bool:
+        """Une las componentes de a y b. Retorna True si eran distintas."""
+        cols = self.cols
+        return self.union_index(a[0] * cols + a[1], b[0] * cols + b[1])
+
+    def connected(self, a: Cell, b: Cell) -> bool:
+        cols = self.cols
+        return self.find(a[0] * cols + a[1]) == self.find(b[0] * cols + b[1])
+
+    def component_size(self, cell: Cell) -> int:
+        return self.size[self.find(cell[0] * self.cols + cell[1])]
+
+    def component_count(self) -> int:
+        return self.count
+
+    def component_sizes(self) -> List[int]:
+        """Tamaños de todas las componentes, de mayor a menor."""
+        sizes = [self.size[i] for i in range(len(self.parent)) if self.parent[i] == i]
+        sizes.sort(reverse=True)
+        return sizes
+
+
+def track(grid: Grid) -> Connectivity:
+    """
+    Construye la conectividad del grid y la engancha a `grid.connectivity`,
+    de modo que cada `remove_wall` posterior la actualiza incrementalmente.
+    """
+    conn = Connectivity(grid)
+    grid.connectivity = conn
+    return conn
@@ -0,0 +1,141 @@
+'''
+
+Solver por relleno de callejones sin salida (dead-end filling)
+
+Creado por Fabián Hevia
+
+'''
+
+from array import array
+from typing import Iterator, List, Optional
+
+from grid import Grid, Cell, Event, OPEN_DEGREE, WALL_UP, WALL_DOWN, WALL_LEFT, WALL_RIGHT, cells_from_indices
+
+# Invierte un bitmap 0/1 con bytes.translate
+_INVERT = bytes([1, 0]) + bytes(254)
+
+
+class DeadEndFill:
+    """
+    Resultado del relleno: `corridor` es un bitmap (índice r * cols + c) con las
+    celdas que sobrevivieron. En un laberinto perfecto el corredor es el único
+    camino start -> goal y queda en `path`; cualquier par de celdas sobre él
+    se responde con `path_between` sin volver a buscar. Si el corredor tiene
+    ciclos (laberinto trenzado) `path` queda vacío.
+    """
+
+    def __init__(self, cols: int, corridor: bytearray, path: List[Cell], filled_count: int):
+        self.cols = cols
+        self.corridor = corridor
+        self.path = path
+        self.filled_count = filled_count
+
+        # Posición de cada celda dentro del camino (-1 si no está)
+        self._order = array("i", [-1]) * len(corridor)
+        for k, (r, c) in enumerate(path):
+            self._order[r * cols + c] = k
+
+    def on_corridor(self, cell: Cell) -> bool:
+        return bool(self.corridor[cell[0] * self.cols + cell[1]])
+
+    def path_between(self, a: Cell, b: Cell) -> Optional[List[Cell]]:
+        """Tramo del camino entre a y b, o None si alguno no está en él."""
+        cols = self.cols
+        i = self._order[a[0] * cols + a[1]]
+        j = self._order[b[0] * cols + b[1]]
+        if i < 0 or j < 0:
+            return None
+        if i <= j:
+            return self.path[i:j + 1]
+        return self.path[j:i + 1][::-1]
+
+
+def _open_neighbors(cols: int, i: int, mask: int) -> Iterator[int]:
+    if not mask & WALL_UP:
+        yield i - cols
+    if not mask & WALL_DOWN:
+        yield i + cols
+    if not mask & WALL_LEFT:
+        yield i - 1
+    if not mask & WALL_RIGHT:
+        yield i + 1
+
+
+def _fill(cols: int, masks: bytearray, filled: bytearray, start: int, goal: int) -> Iterator[int]:
+    """Rellena callejones con una worklist y va entregando cada celda rellenada."""
+    degree = masks.translate(OPEN_DEGREE)
+    protected = (start, goal)
+
+    work = array("i", (i for i, d in enumerate(degree) if d <= 1 and i not in protected))
+    while work:
+        i = work.pop()
+        if filled[i]:
+            continue
+        filled[i] = 1
+        yield i
+
+        for j in _open_neighbors(cols, i, masks[i]):
+            if filled[j]:
+                continue
+            degree[j] -= 1
+            if degree[j] <= 1 and j not in protected:
+                work.append(j)
+
+
+def _trace(cols: int, masks: bytearray, filled: bytearray, start: int, goal: int) -> List[Cell]:
+    """Recorre el corredor desde start; vacío si no es un camino simple hasta goal."""
+    trail = array("i", [start])
+    prev, cur = -1, start
+
+    while cur != goal:
+        nxt = [j for j in _open_neighbors(cols, cur, masks[cur]) if j != prev and not filled[j]]
+        if len(nxt) != 1:
+            return []
+        prev, cur = cur, nxt[0]
+        trail.append(cur)
+
+    return cells_from_indices(trail, len(masks) // cols, cols)
+
+
+def solve(grid: Grid, start: Optional[Cell] = None, goal: Optional[Cell] = None) -> DeadEndFill:
+    """Relleno completo en una pasada lineal, sin eventos."""
+    start = grid.start if start is None else start
+    goal = grid.goal if goal is None else goal
+
+    cols = grid.cols
+    masks = grid.walls
+    filled = bytearray(len(masks))
+    s, g = start[0] * cols + start[1], goal[0] * cols + goal[1]
+
+    count = sum(1 for _ in _fill(cols, masks, filled, s, g))
+    corridor = filled.translate(_INVERT)
+    return DeadEndFill(cols, corridor, _trace(cols, masks, filled, s, g), count)
+
+
+def events(grid: Grid, start: Optional[Cell] = None, goal: Optional[Cell] = None) -> Iterator[Event]:
+    """
+    Versión animada: emite "start", un "fill" por celda rellenada y "done"
+    con el camino resultante, compatible con MainWindow.process_event.
+    """
+    start = grid.start if start is None else start
+    goal = grid.goal if goal is None else goal
+
+    cols = grid.cols
+    masks = grid.walls
+    filled = bytearray(len(masks))
+    s, g = start[0] * cols + start[1], goal[0] * cols + goal[1]
+
+    yield {"event": "start", "cell": start, "filled_count": 0}
+
+    count = 0
+    for i in _fill(cols, masks, filled, s, g):
+        count += 1
+        yield {"event": "fill", "cell": divmod(i, cols), "filled_count": count}
+
+    path = _trace(cols, masks, filled, s, g)
+    yield {
+        "event": "done",
+        "path": path,
+        "path_length": len(path),
+        "filled_count": count
+    }
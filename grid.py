@@ -0,0 +1,589 @@
+'''
+
+Modelo del grid y algoritmos (sin dependencia de Tk)
+
+Creado por Fabián Hevia
+
+'''
+
+import heapq
+import random
+from array import array
+from typing import Tuple, List, Dict, Iterable, Iterator, Optional
+from collections import deque
+
+Cell = Tuple[int, int]
+Event = Dict[str, any]
+
+# Bits de muro por celda (máscara compacta de 4 bits)
+WALL_UP = 1
+WALL_DOWN = 2
+WALL_LEFT = 4
+WALL_RIGHT = 8
+ALL_WALLS = WALL_UP | WALL_DOWN | WALL_LEFT | WALL_RIGHT
+
+# Grado abierto de una celda según su máscara de muros (4 - muros), para bytes.translate
+OPEN_DEGREE = bytes(4 - bin(m & ALL_WALLS).count("1") for m in range(256))
+
+def parse_cell(text: str) -> Optional[Cell]:
+    # "r,c" -> (r, c); vacío -> None (usar el valor por defecto del grid)
+    text = text.strip()
+    if text == "":
+        return None
+    r, c = text.split(",")
+    return int(r), int(c)
+
+def cells_from_indices(indices: Iterable[int], rows: int, cols: int) -> List[Cell]:
+    """
+    Convierte índices r * cols + c en celdas (r, c). Las filas y columnas
+    salen de tablas compartidas, así las tuplas de un camino largo no traen
+    cada una sus propios ints (la mitad de la memoria del camino).
+    """
+    row_ids = list(range(rows))
+    col_ids = list(range(cols))
+    return [(row_ids[i // cols], col_ids[i % cols]) for i in indices]
+
+class Grid:
+    """
+    Grid de rows x cols celdas. Los muros viven en `self.walls`, un bytearray
+    con una máscara de 4 bits por celda (índice r * cols + c), así que la
+    memoria es lineal y no hay un dict por celda.
+    """
+
+    def __init__(self, rows: int, cols: Optional[int] = None,
+                 start: Optional[Cell] = None, goal: Optional[Cell] = None):
+
+        # Crea los atributos de la clase (Grid(n) sigue siendo un grid n x n)
+        if cols is None:
+            cols = rows
+        if rows < 1 or cols < 1:
+            raise ValueError("El grid necesita al menos 1 fila y 1 columna")
+
+        self.rows = rows
+        self.cols = cols
+        self.start = (0, 0) if start is None else tuple(start)
+        self.goal = (rows - 1, cols - 1) if goal is None else tuple(goal)
+
+        for name, cell in (("start", self.start), ("goal", self.goal)):
+            if not self.in_bounds(*cell):
+                raise ValueError(f"{name} {cell} fuera del grid {rows}x{cols}")
+
+        # Donde el índice de (r, c) es r * cols + c
+        self.walls = bytearray([ALL_WALLS]) * (rows * cols)
+
+        self.playing = True
+
+        # Union-find opcional (ver connectivity.track), se actualiza en remove_wall
+        self.connectivity = None
+
+    def in_bounds(self, r, c):
+
+        # Dentro de los limites tendriamos a 0 <= row < rows y 0 <= col < cols
+        return 0 <= r < self.rows and 0 <= c < self.cols
+
+    def neighbors(self, r, c):
+
+        # Representamos posibles con las 4 posiciones posibles
+        posibles = [(r-1, c), (r+1, c), (r, c-1), (r, c+1)]
+        return [(rr, cc) for (rr, cc) in posibles if self.in_bounds(rr, cc)]
+    
+    def neighbors_open(self, r, c):
+        """Devuelve los vecinos a los que se puede avanzar (sin muro)."""
+        open_nbrs = []
+        mask = self.walls[r * self.cols + c]
+
+        if not mask & WALL_UP:
+            open_nbrs.append((r-1, c))
+
+        if not mask & WALL_DOWN:
+            open_nbrs.append((r+1, c))
+
+        if not mask & WALL_LEFT:
+            open_nbrs.append((r, c-1))
+
+        if not mask & WALL_RIGHT:
+            open_nbrs.append((r, c+1))
+
+        return open_nbrs
+
+    def _adjacent(self, i: int) -> List[Tuple[int, int, int]]:
+        """Vecinos dentro del grid del índice i como (j, muro en i, muro en j)."""
+        cols = self.cols
+        r, c = divmod(i, cols)
+        adj = []
+        if r > 0:
+            adj.append((i - cols, WALL_UP, WALL_DOWN))
+        if r < self.rows - 1:
+            adj.append((i + cols, WALL_DOWN, WALL_UP))
+        if c > 0:
+            adj.append((i - 1, WALL_LEFT, WALL_RIGHT))
+        if c < cols - 1:
+            adj.append((i + 1, WALL_RIGHT, WALL_LEFT))
+        return adj
+
+    def _carve(self, i: int, j: int, wall_i: int, wall_j: int) -> None:
+        # Quita el muro compartido entre los índices i y j
+        self.walls[i] &= ~wall_i
+        self.walls[j] &= ~wall_j
+
+        # Mantener la conectividad incremental si está activa
+        if self.connectivity is not None:
+            self.connectivity.union_index(i, j)
+    
+    def remove_wall(self, a: Cell, b: Cell) -> None:
+        (ar, ac), (br, bc) = a, b
+
+        # Fuera del grid no hay muro que quitar
+        if not (self.in_bounds(ar, ac) and self.in_bounds(br, bc)):
+            return
+
+        i = ar * self.cols + ac
+        j = br * self.cols + bc
+
+        if ar == br:
+            # Movimiento horizontal
+            if ac + 1 == bc:
+                # b está a la derecha de a
+                self._carve(i, j, WALL_RIGHT, WALL_LEFT)
+            elif ac - 1 == bc:
+                # b está a la izquierda de a
+                self._carve(i, j, WALL_LEFT, WALL_RIGHT)
+
+        elif ac == bc:
+            # Movimiento vertical
+            if ar + 1 == br:
+                # b está abajo de a
+                self._carve(i, j, WALL_DOWN, WALL_UP)
+            elif ar - 1 == br:
+                # b está arriba de a
+                self._carve(i, j, WALL_UP, WALL_DOWN)
+
+        else:
+            # No adyacentes, entonces no hace nada
+            pass
+
+    def braid(self, fraction: float = 0.5, seed: Optional[int] = None) -> int:
+        """
+        Elimina una fracción de los callejones sin salida quitando un muro
+        de cada uno, lo que agrega ciclos al laberinto. Prefiere abrir hacia
+        otro callejón para resolver dos de una vez. Retorna los muros quitados.
+        """
+        rng = random.Random(seed)
+        walls = self.walls
+
+        degree = walls.translate(OPEN_DEGREE)
+        dead_ends = [i for i, d in enumerate(degree) if d == 1]
+        rng.shuffle(dead_ends)
+        target = dead_ends[:round(max(0.0, min(1.0, fraction)) * len(dead_ends))]
+
+        removed = 0
+        for i in target:
+            # Un muro quitado antes pudo haber resuelto este callejón
+            if OPEN_DEGREE[walls[i]] != 1:
+                continue
+
+            closed = [adj for adj in self._adjacent(i) if walls[i] & adj[1]]
+            if not closed:
+                continue
+
+            paired = [adj for adj in closed if OPEN_DEGREE[walls[adj[0]]] == 1]
+            j, wall_i, wall_j = rng.choice(paired or closed)
+            self._carve(i, j, wall_i, wall_j)
+            removed += 1
+
+        return removed
+
+    def wall_masks(self) -> bytearray:
+        """
+        Devuelve una copia de los muros como bytearray fila por fila (índice
+        r * cols + c), un byte por celda con los bits WALL_UP/WALL_DOWN/
+        WALL_LEFT/WALL_RIGHT. Para solo leer, usar `self.walls` directamente.
+        """
+        return bytearray(self.walls)
+    
+    def recursive_backtracker(self, seed: Optional[int] = None, yield_events: bool = False) -> Optional[Iterator[Event]]:
+        """
+        Genera un laberinto usando recursive backtracker (DFS con stack).
+        Si yield_events == True, devuelve un iterador (generator) que
+        emite eventos dict por cada carve/backtrack.
+        Si yield_events == False, simplemente ejecuta la generación y retorna None.
+
+        El stack es un array de índices y visited un bytearray, así que la
+        memoria es lineal incluso con decenas de millones de celdas.
+        """
+
+        rng = random.Random(seed)
+        cols = self.cols
+
+        root = self.start[0] * cols + self.start[1]
+        visited = bytearray(self.rows * cols)
+        stack = array("i", [root])
+        visited[root] = 1
+        visited_count = 1
+
+        # Si queremos yieldear eventos, definimos el generator
+        def generator():
+            nonlocal visited_count
+
+            # Evento inicial opcional
+            if yield_events:
+                yield {"event": "start", "cell": self.start, "visited_count": visited_count, "stack_depth": len(stack)}
+
+            while stack:
+                current = stack[-1]
+
+                # Vecinos que aún no han sido visitados
+                nbrs = [adj for adj in self._adjacent(current) if not visited[adj[0]]]
+
+                if nbrs:
+                    chosen, wall_i, wall_j = rng.choice(nbrs)
+                    self._carve(current, chosen, wall_i, wall_j)
+                    visited[chosen] = 1
+                    visited_count += 1
+                    stack.append(chosen)
+
+                    # Emitir evento de carve
+                    if yield_events:
+                        yield {
+                            "event": "carve",
+                            "from": divmod(current, cols),
+                            "to": divmod(chosen, cols),
+                            "visited_count": visited_count,
+                            "stack_depth": len(stack)
+                        }
+
+                else:
+                    # Backtrack
+                    popped = stack.pop()
+                    if yield_events:
+                        yield {
+                            "event": "backtrack",
+                            "cell": divmod(popped, cols),
+                            "visited_count": visited_count,
+                            "stack_depth": len(stack)
+                        }
+
+            if yield_events:
+                yield {"event": "done", "visited_count": visited_count, "stack_depth": 0}
+
+        if yield_events:
+            return generator()
+        
+        else:
+            for _ in generator():
+                pass
+            return None
+
+    def bfs(self, start: Cell, goal: Cell, yield_events: bool = False) -> Optional[Iterator[Event]]:
+        cols = self.cols
+        walls = self.walls
+        s = start[0] * cols + start[1]
+        t = goal[0] * cols + goal[1]
+
+        # parent[i] == -1 significa no visitado; el start es su propio padre
+        parent = array("i", [-1]) * (self.rows * cols)
+        parent[s] = s
+        visited_count = 1
+
+        # Cola FIFO sobre un array de índices (4 bytes por celda en cola, sin
+        # ints en caja); lo ya consumido se descarta cuando es la mitad
+        queue = array("i", [s])
+        head = 0
+
+        # Con conectividad activa, una meta inalcanzable se descarta en O(α(n))
+        reachable = self.connectivity is None or self.connectivity.connected(start, goal)
+
+        def generator():
+            nonlocal visited_count, queue, head
+
+            if yield_events:
+                yield {
+                    "event": "start",
+                    "cell": start,
+                    "visited_count": visited_count,
+                    "queue_size": 1
+                }
+
+            while head < len(queue) and reachable:
+                current = queue[head]
+                head += 1
+                if head >= 1024 and 2 * head >= len(queue):
+                    del queue[:head]
+                    head = 0
+
+                if yield_events:
+                    yield {
+                        "event": "expand",
+                        "cell": divmod(current, cols),
+                        "queue_size": len(queue) - head,
+                        "visited_count": visited_count
+                    }
+
+                if current == t:
+                    break
+
+                mask = walls[current]
+                for nb, wall in ((current - cols, WALL_UP), (current + cols, WALL_DOWN),
+                                 (current - 1, WALL_LEFT), (current + 1, WALL_RIGHT)):
+                    if not mask & wall and parent[nb] < 0:
+                        parent[nb] = current
+                        visited_count += 1
+                        queue.append(nb)
+
+                        if yield_events:
+                            yield {
+                                "event": "discover",
+                                "from": divmod(current, cols),
+                                "to": divmod(nb, cols),
+                                "queue_size": len(queue) - head,
+                                "visited_count": visited_count
+                            }
+
+            path = []
+            if parent[t] >= 0:
+                trail = array("i", [t])
+                cur = t
+                while cur != s:
+                    cur = parent[cur]
+                    trail.append(cur)
+                trail.reverse()
+                path = cells_from_indices(trail, self.rows, cols)
+
+            yield {
+                "event": "done",
+                "path": path,
+                "path_length": len(path)
+            }
+
+        if yield_events:
+            return generator()
+
+        for _ in generator():
+            pass
+        return None
+
+    def jps(self, start: Cell, goal: Cell, yield_events: bool = False) -> Optional[Iterator[Event]]:
+        """
+        Jump Point Search para el grid 4-conexo con muros entre celdas.
+
+        En vez de expandir celda por celda, salta en línea recta hasta un
+        "jump point" (la meta o una celda con un vecino forzado) y solo esos
+        puntos entran a la cola de prioridad (A* con distancia Manhattan).
+        Emite los mismos eventos que bfs: start/expand/discover/done, donde
+        expand/discover corresponden a jump points.
+        """
+        cols = self.cols
+        walls = self.walls
+        gr, gc = goal
+        s = start[0] * cols + start[1]
+        t = gr * cols + gc
+        total = self.rows * cols
+
+        # Cada salto guarda su resultado por celda (-2 sin calcular, -1 sin jump
+        # point). Las celdas recorridas antes de donde para un salto comparten
+        # el resultado, así cada celda se escanea una vez por dirección aunque
+        # los saltos verticales consulten los horizontales en cada paso.
+        unknown = -2
+
+        def memo_jump(step, wall, is_jump_point):
+            memo = array("i", [unknown]) * total
+
+            def jump(i):
+                if memo[i] != unknown:
+                    return memo[i]
+
+                first, found = i, -1
+                while not walls[i] & wall:
+                    i += step
+                    if i == t or is_jump_point(i, i - step):
+                        found = i
+                        break
+                    if memo[i] != unknown:
+                        found = memo[i]
+                        break
+
+                last = i - step if found == i else i
+                if last == first:
+                    memo[first] = found
+                elif step > 0:
+                    memo[first:last + 1:step] = array("i", [found]) * ((last - first) // step + 1)
+                else:
+                    memo[last:first + 1:-step] = array("i", [found]) * ((first - last) // -step + 1)
+                return found
+
+            return jump
+
+        def forced(wall):
+            # Horizontal: se puede subir/bajar aquí, pero no por la celda anterior
+            def check(i, prev):
+                mask, pmask = walls[i], walls[prev]
+                return ((not mask & WALL_UP and (pmask & WALL_UP or walls[prev - cols] & wall)) or
+                        (not mask & WALL_DOWN and (pmask & WALL_DOWN or walls[prev + cols] & wall)))
+            return check
+
+        jump_left = memo_jump(-1, WALL_LEFT, forced(WALL_LEFT))
+        jump_right = memo_jump(1, WALL_RIGHT, forced(WALL_RIGHT))
+
+        def turns(i, prev):
+            # Vertical: es jump point si un salto horizontal encuentra algo
+            return jump_left(i) >= 0 or jump_right(i) >= 0
+
+        # (paso en índices, salto) en el orden arriba, abajo, izquierda, derecha
+        directions = (
+            (-cols, memo_jump(-cols, WALL_UP, turns)),
+            (cols, memo_jump(cols, WALL_DOWN, turns)),
+            (-1, jump_left),
+            (1, jump_right),
+        )
+
+        def h(i):
+            r, c = divmod(i, cols)
+            return abs(r - gr) + abs(c - gc)
+
+        # Entradas del heap como un solo int (f, g, índice) en base M: mismo
+        # orden que las tuplas, sin una tupla por entrada
+        M = total + 1
+        heap = [h(s) * M * M + s]
+        g_cost = array("i", [-1]) * total
+        parent = array("i", [-1]) * total
+        closed = bytearray(total)
+        g_cost[s] = 0
+        seen = 1
+
+        reachable = self.connectivity is None or self.connectivity.connected(start, goal)
+
+        def generator():
+            nonlocal seen
+
+            if yield_events:
+                yield {
+                    "event": "start",
+                    "cell": start,
+                    "visited_count": seen,
+                    "queue_size": len(heap)
+                }
+
+            while heap and reachable:
+                key = heapq.heappop(heap)
+                current = key % M
+                g = key // M % M
+                if closed[current] or g > g_cost[current]:
+                    continue
+                closed[current] = 1
+
+                if yield_events:
+                    yield {
+                        "event": "expand",
+                        "cell": divmod(current, cols),
+                        "queue_size": len(heap),
+                        "visited_count": seen
+                    }
+
+                if current == t:
+                    break
+
+                # Paso que apunta hacia el padre, para no volver por donde se llegó
+                back = 0
+                if parent[current] >= 0:
+                    d = parent[current] - current
+                    back = (cols if d > 0 else -cols) if d % cols == 0 else (1 if d > 0 else -1)
+
+                for step, jump in directions:
+                    if step == back:
+                        continue
+
+                    jp = jump(current)
+                    if jp < 0:
+                        continue
+
+                    dist = abs(jp - current)
+                    ng = g + (dist if step in (1, -1) else dist // cols)
+                    if g_cost[jp] >= 0 and ng >= g_cost[jp]:
+                        continue
+
+                    first_seen = g_cost[jp] < 0
+                    g_cost[jp] = ng
+                    parent[jp] = current
+                    heapq.heappush(heap, ((ng + h(jp)) * M + ng) * M + jp)
+
+                    if first_seen:
+                        seen += 1
+                        if yield_events:
+                            yield {
+                                "event": "discover",
+                                "from": divmod(current, cols),
+                                "to": divmod(jp, cols),
+                                "queue_size": len(heap),
+                                "visited_count": seen
+                            }
+
+            # Reconstrucción: rellenar los tramos rectos entre jump points
+            path = []
+            if closed[t]:
+                trail = array("i")
+                cur = t
+                while cur != s:
+                    prev = parent[cur]
+                    pr, pc = divmod(prev, cols)
+                    r, c = divmod(cur, cols)
+                    step = ((pr > r) - (pr < r)) * cols + (pc > c) - (pc < c)
+                    while cur != prev:
+                        trail.append(cur)
+                        cur += step
+                trail.append(s)
+                trail.reverse()
+                path = cells_from_indices(trail, self.rows, cols)
+
+            yield {
+                "event": "done",
+                "path": path,
+                "path_length": len(path)
+            }
+
+        if yield_events:
+            return generator()
+
+        for _ in generator():
+            pass
+        return None
+    '''
+    def bfs_shortest_path(self, start=None, goal=None):
+
+        if start is None:
+            start = self.start
+
+        if goal is None:
+            goal = self.goal
+
+        queue = deque([start])
+        visited = {start}
+        parent = {start: None}
+
+        while queue:
+            current = queue.popleft()
+
+            if current == goal:
+                break
+
+            for nb in self.neighbors_open(*current):
+
+                if nb not in visited:
+
+                    visited.add(nb)
+                    parent[nb] = current
+                    queue.append(nb)
+
+        # Reconstrucción del camino
+        if goal not in parent:
+            return []
+
+        path = []
+        cur = goal
+
+        while cur is not None:
+            path.append(cur)
+            cur = parent[cur]
+
+        path.reverse()
+        return path
+    '''
@@ -6,17 +6,24 @@ Creado por Fabián Hevia
 
 '''
 
-import random
 import tkinter as tk
-from typing import Tuple, List, Dict, Iterator, Optional, Any
-from tkinter import ttk
-from collections import deque
+from typing import List, Dict, Iterator, Optional, Any
+from tkinter import ttk, filedialog
 
-def menu():
-    print("\nBienvenido a Python BFS search environment\n")
+from grid import Grid, Cell, parse_cell, WALL_UP, WALL_DOWN, WALL_LEFT, WALL_RIGHT, ALL_WALLS
+from timeline import Timeline, KIND_MAZE, KIND_BFS, KIND_JPS, KIND_FILL
+import deadend
+from profiling import Profiler, TimedWidget, TimedIterator
 
+# Tamaño mínimo por lado y máximo de celdas que la ventana puede dibujar y
+# animar (cada celda son varios items del canvas). Para grids más grandes
+# está bench.py, que no usa Tk.
+MIN_SIDE = 3
+MAX_GUI_CELLS = 40_000
+
+def leer_lado(mensaje: str) -> int:
     while True:
-        entrada = input("Indica el ancho del grid (entre 3 y 200): ")
+        entrada = input(mensaje)
         
         # Valida que realmente sea número
         try:
@@ -26,285 +33,60 @@ def menu():
             continue
 
         # Valida el rango del grid
-        if 3 <= a <= 200:
+        if a >= MIN_SIDE:
             return a
         else:
-            print("El número debe estar entre 3 y 200. Intenta de nuevo.")
-
-Cell = Tuple[int, int]
-Event = Dict[str, any]
-
-class Grid:
-    def __init__(self, n):
-
-        # Crea los atributos de la clase
-        self.n = n
-        self.start = (0, 0)
-        self.goal = (n - 1, n - 1)
-
-        self.cells = {
-
-            # Donde r = row, c = col
-            (r, c): {
-                "wall_up": True,
-                "wall_down": True,
-                "wall_left": True,
-                "wall_right": True
-            }
-            for r in range(n)
-            for c in range(n)
-        }
-
-        self.playing = True
-
-    def in_bounds(self, r, c):
-
-        # Dentro de los limites tendriamos a 0 <= row < n y 0 <= col < n
-        return 0 <= r < self.n and 0 <= c < self.n
-
-    def neighbors(self, r, c):
-
-        # Representamos posibles con las 4 posiciones posibles
-        posibles = [(r-1, c), (r+1, c), (r, c-1), (r, c+1)]
-        return [(rr, cc) for (rr, cc) in posibles if self.in_bounds(rr, cc)]
-    
-    def neighbors_open(self, r, c):
-        """Devuelve los vecinos a los que se puede avanzar (sin muro)."""
-        open_nbrs = []
-        cell = self.cells[(r, c)]
-
-        if not cell["wall_up"]:
-            open_nbrs.append((r-1, c))
-
-        if not cell["wall_down"]:
-            open_nbrs.append((r+1, c))
-
-        if not cell["wall_left"]:
-            open_nbrs.append((r, c-1))
-
-        if not cell["wall_right"]:
-            open_nbrs.append((r, c+1))
-
-        return open_nbrs
-    
-    def remove_wall(self, a: Cell, b: Cell) -> None:
-        (ar, ac), (br, bc) = a, b
-
-        if ar == br:
-            # Movimiento horizontal
-            if ac + 1 == bc:
-                # b está a la derecha de a
-                self.cells[a]["wall_right"] = False
-                self.cells[b]["wall_left"] = False
-            elif ac - 1 == bc:
-                # b está a la izquierda de a
-                self.cells[a]["wall_left"] = False
-                self.cells[b]["wall_right"] = False
-
-        elif ac == bc:
-            # Movimiento vertical
-            if ar + 1 == br:
-                # b está abajo de a
-                self.cells[a]["wall_down"] = False
-                self.cells[b]["wall_up"] = False
-            elif ar - 1 == br:
-                # b está arriba de a
-                self.cells[a]["wall_up"] = False
-                self.cells[b]["wall_down"] = False
-
-        else:
-            # No adyacentes, entonces no hace nada
-            pass
-    
-    def recursive_backtracker(self, seed: Optional[int] = None, yield_events: bool = False) -> Optional[Iterator[Event]]:
-        """
-        Genera un laberinto usando recursive backtracker (DFS con stack).
-        Si yield_events == True, devuelve un iterador (generator) que
-        emite eventos dict por cada carve/backtrack.
-        Si yield_events == False, simplemente ejecuta la generación y retorna None.
-        """
-
-        rng = random.Random(seed)
-
-        visited = set()
-        stack: List[Cell] = [self.start]
-        visited.add(self.start)
-
-        # Si queremos yieldear eventos, definimos el generator
-        def generator():
-
-            # Evento inicial opcional
-            yield {"event": "start", "cell": self.start, "visited_count": len(visited), "stack_depth": len(stack)}
-
-            while stack:
-                current = stack[-1]
-                r, c = current
-
-                # Vecinos que aún no han sido visitados
-                nbrs = [nb for nb in self.neighbors(r, c) if nb not in visited]
-
-                if nbrs:
-                    chosen = rng.choice(nbrs)
-                    self.remove_wall(current, chosen)
-                    visited.add(chosen)
-                    stack.append(chosen)
-
-                    # Emitir evento de carve
-                    yield {
-                        "event": "carve",
-                        "from": current,
-                        "to": chosen,
-                        "visited_count": len(visited),
-                        "stack_depth": len(stack)
-                    }
-
-                else:
-                    # Backtrack
-                    popped = stack.pop()
-                    yield {
-                        "event": "backtrack",
-                        "cell": popped,
-                        "visited_count": len(visited),
-                        "stack_depth": len(stack)
-                    }
-
-            yield {"event": "done", "visited_count": len(visited), "stack_depth": 0}
-
-        if yield_events:
-            return generator()
-        
-        else:
-            for _ in generator():
-                pass
-            return None
-
-    def bfs(self, start: Cell, goal: Cell, yield_events: bool = False) -> Optional[Iterator[Event]]:
-        from collections import deque
-
-        queue = deque([start])
-        visited = {start}
-        parent = {start: None}
-
-        def generator():
-            yield {
-                "event": "start",
-                "cell": start,
-                "visited_count": len(visited),
-                "queue_size": len(queue)
-            }
-
-            while queue:
-                current = queue.popleft()
-
-                yield {
-                    "event": "expand",
-                    "cell": current,
-                    "queue_size": len(queue),
-                    "visited_count": len(visited)
-                }
-
-                if current == goal:
-                    break
-
-                for nb in self.neighbors_open(*current):
-                    if nb not in visited:
-                        visited.add(nb)
-                        parent[nb] = current
-                        queue.append(nb)
-
-                        yield {
-                            "event": "discover",
-                            "from": current,
-                            "to": nb,
-                            "queue_size": len(queue),
-                            "visited_count": len(visited)
-                        }
-
-            path = []
-            if goal in parent:
-                cur = goal
-                while cur is not None:
-                    path.append(cur)
-                    cur = parent[cur]
-                path.reverse()
-
-            yield {
-                "event": "done",
-                "path": path,
-                "path_length": len(path)
-            }
-
-        if yield_events:
-            return generator()
-
-        for _ in generator():
-            pass
-        return None      
-    '''
-    def bfs_shortest_path(self, start=None, goal=None):
-
-        if start is None:
-            start = self.start
-
-        if goal is None:
-            goal = self.goal
-
-        queue = deque([start])
-        visited = {start}
-        parent = {start: None}
+            print(f"El número debe ser al menos {MIN_SIDE}. Intenta de nuevo.")
 
-        while queue:
-            current = queue.popleft()
-
-            if current == goal:
-                break
-
-            for nb in self.neighbors_open(*current):
-
-                if nb not in visited:
-
-                    visited.add(nb)
-                    parent[nb] = current
-                    queue.append(nb)
-
-        # Reconstrucción del camino
-        if goal not in parent:
-            return []
-
-        path = []
-        cur = goal
+def menu():
+    print("\nBienvenido a Python BFS search environment\n")
 
-        while cur is not None:
-            path.append(cur)
-            cur = parent[cur]
+    while True:
+        rows = leer_lado(f"Indica el alto del grid (filas, mínimo {MIN_SIDE}): ")
+        cols = leer_lado(f"Indica el ancho del grid (columnas, mínimo {MIN_SIDE}): ")
 
-        path.reverse()
-        return path
-    '''  
+        # Valida que la ventana lo pueda dibujar
+        if rows * cols <= MAX_GUI_CELLS:
+            return rows, cols
+        print(f"El grid puede tener como máximo {MAX_GUI_CELLS} celdas (usa bench.py para grids más grandes).")
 
 # Visualizador del Grid
 class MainWindow(tk.Tk):
-    def __init__(self, n: int):
+    def __init__(self, rows: int, cols: int, profile: bool = False):
         super().__init__()
         self.title("Python BFS search environment")
         self.geometry("900x700")
 
         # Estados Runtime
-        self.GRID_ROWS = n
-        self.PADDING = max(8, n)
+        self.GRID_ROWS = rows
+        self.GRID_COLS = cols
+        self.PADDING = max(8, min(rows, cols, 40))
         self.CELL_PX = 0
 
         self.grid = None  # Se asigna durante la ejecución
         self.gen: Optional[Iterator] = None
+        self.timeline: Optional[Timeline] = None
         self.playing: bool = False
         self.after_id: Optional[Any] = None
         self.delay_ms: int = 100
         self.draw_items: Dict[str, int] = {}
         self.BATCH_SIZE = 10
 
+        # Lo que hay pintado en el canvas (None = desconocido), para que el
+        # slider solo reconfigure las celdas y muros que cambian
+        self._drawn_fills: Optional[List[str]] = None
+        self._drawn_walls: Optional[bytearray] = None
+        self._redraw_id: Optional[Any] = None
+        self.profiler: Optional[Profiler] = None
+
         # UI
         self.setup_ui()
+        # Widgets que el perfilado envuelve para cronometrar las llamadas a Tk
+        self._raw_widgets = {name: getattr(self, name) for name in ("canvas", "status_label", "scrub_slider")}
         self.canvas.bind("<Configure>", self.on_canvas_configure)
+        if profile:
+            self.profile_var.set(True)
+            self.enable_profiling()
         self.status_label.config(text="Estado: Ingrese semilla y genere laberinto.")
 
     # UI setup
@@ -313,11 +95,17 @@ class MainWindow(tk.Tk):
         self.control_frame = tk.Frame(self, bg="#f0f0f0", pady=6)
         self.control_frame.pack(side=tk.TOP, fill=tk.X)
 
-        tk.Label(self.control_frame, text="Tamaño (n):").pack(side=tk.LEFT, padx=4)
-        self.size_spin = tk.Spinbox(self.control_frame, from_=3, to=200, width=5, command=self.on_size_change)
-        self.size_spin.delete(0, "end")
-        self.size_spin.insert(0, str(self.GRID_ROWS))
-        self.size_spin.pack(side=tk.LEFT, padx=4)
+        tk.Label(self.control_frame, text="Filas:").pack(side=tk.LEFT, padx=4)
+        self.rows_spin = tk.Spinbox(self.control_frame, from_=MIN_SIDE, to=MAX_GUI_CELLS // MIN_SIDE, width=6, command=self.on_size_change)
+        self.rows_spin.delete(0, "end")
+        self.rows_spin.insert(0, str(self.GRID_ROWS))
+        self.rows_spin.pack(side=tk.LEFT, padx=4)
+
+        tk.Label(self.control_frame, text="Columnas:").pack(side=tk.LEFT, padx=4)
+        self.cols_spin = tk.Spinbox(self.control_frame, from_=MIN_SIDE, to=MAX_GUI_CELLS // MIN_SIDE, width=6, command=self.on_size_change)
+        self.cols_spin.delete(0, "end")
+        self.cols_spin.insert(0, str(self.GRID_COLS))
+        self.cols_spin.pack(side=tk.LEFT, padx=4)
 
         # Importamos la semilla
         tk.Label(self.control_frame, text="Semilla:").pack(side=tk.LEFT, padx=4)
@@ -341,12 +129,40 @@ class MainWindow(tk.Tk):
         # Botón para ejecutar BFS sobre el laberinto ya generado
         self.btn_bfs = tk.Button(self.control_frame, text="Run BFS", command=self.on_run_bfs)
         self.btn_bfs.pack(side=tk.LEFT, padx=6)
+        self.btn_jps = tk.Button(self.control_frame, text="Run JPS", command=self.on_run_jps)
+        self.btn_jps.pack(side=tk.LEFT, padx=6)
+        self.btn_fill = tk.Button(self.control_frame, text="Dead-end Fill", command=self.on_run_fill)
+        self.btn_fill.pack(side=tk.LEFT, padx=6)
 
         tk.Label(self.control_frame, text="Velocidad:").pack(side=tk.LEFT, padx=4)
         self.speed_slider = tk.Scale(self.control_frame, from_=1, to=200, orient=tk.HORIZONTAL, command=self.on_speed_change)
         self.speed_slider.set(100)
         self.speed_slider.pack(side=tk.LEFT, padx=6)
 
+        # Slider para moverse por la línea de tiempo (adelante y atrás)
+        self.scrub_frame = tk.Frame(self, bg="#f0f0f0")
+        self.scrub_frame.pack(side=tk.TOP, fill=tk.X)
+
+        # Inicio y meta opcionales como "r,c" (vacío = esquinas)
+        tk.Label(self.scrub_frame, text="Inicio (r,c):").pack(side=tk.LEFT, padx=4)
+        self.start_entry = tk.Entry(self.scrub_frame, width=10)
+        self.start_entry.pack(side=tk.LEFT, padx=4)
+        tk.Label(self.scrub_frame, text="Meta (r,c):").pack(side=tk.LEFT, padx=4)
+        self.goal_entry = tk.Entry(self.scrub_frame, width=10)
+        self.goal_entry.pack(side=tk.LEFT, padx=4)
+
+        tk.Label(self.scrub_frame, text="Paso:").pack(side=tk.LEFT, padx=4)
+        self.scrub_slider = tk.Scale(self.scrub_frame, from_=0, to=0, orient=tk.HORIZONTAL, showvalue=True, command=self.on_scrub)
+        self.scrub_slider.bind("<ButtonPress-1>", lambda e: self.on_pause())
+        self.scrub_slider.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=6)
+
+        # Perfilado opcional del loop de animación
+        self.profile_var = tk.BooleanVar(value=False)
+        self.profile_check = tk.Checkbutton(self.scrub_frame, text="Perfilar", variable=self.profile_var, command=self.on_toggle_profile)
+        self.profile_check.pack(side=tk.LEFT, padx=4)
+        self.btn_trace = tk.Button(self.scrub_frame, text="Guardar traza", command=self.on_save_trace)
+        self.btn_trace.pack(side=tk.LEFT, padx=6)
+
         # Canvas del contenido principal
         self.canvas = tk.Canvas(self, bg="white", highlightthickness=0)
         self.canvas.pack(side=tk.TOP, fill=tk.BOTH, expand=True)
@@ -354,14 +170,18 @@ class MainWindow(tk.Tk):
         # Status
         self.status_label = tk.Label(self, text="Estado: ...", bd=1, relief=tk.SUNKEN, anchor=tk.W)
         self.status_label.pack(side=tk.BOTTOM, fill=tk.X)
+        self.profile_label = tk.Label(self, text="", bd=1, relief=tk.SUNKEN, anchor=tk.W)
+        self.profile_label.pack(side=tk.BOTTOM, fill=tk.X)
 
     # Handlers
     def on_size_change(self):
+        # El tamaño nuevo se aplica recién en on_generate; el grid actual no cambia
         try:
-            v = int(self.size_spin.get())
-            self.GRID_ROWS = max(3, v)
+            rows = max(MIN_SIDE, int(self.rows_spin.get()))
+            cols = max(MIN_SIDE, int(self.cols_spin.get()))
         except Exception:
-            pass
+            return
+        self.status_label.config(text=f"Tamaño {rows}x{cols}: se aplica al generar.")
 
     def on_speed_change(self, val):
         try:
@@ -372,22 +192,50 @@ class MainWindow(tk.Tk):
 
     def on_canvas_configure(self, event):
         # Recalcular tamaño de las celdas y redesenerizar
-        width = event.width
-        height = event.height
-        size_px = min(width, height) - 2 * self.PADDING
-        self.CELL_PX = max(4, max(1, size_px) // max(1, self.GRID_ROWS))
-        self.draw_grid()
+        self._fit_cells(event.width, event.height)
+        if self.timeline is not None:
+            self.draw_timeline_state(rebuild=True)
+        else:
+            self.draw_grid()
+
+    def _grid_shape(self):
+        # Filas y columnas de lo que hay dibujado: las del grid si existe
+        if self.grid is not None:
+            return self.grid.rows, self.grid.cols
+        return self.GRID_ROWS, self.GRID_COLS
+
+    def _fit_cells(self, width: int, height: int):
+        rows, cols = self._grid_shape()
+        fit_w = (width - 2 * self.PADDING) // max(1, cols)
+        fit_h = (height - 2 * self.PADDING) // max(1, rows)
+        self.CELL_PX = max(2, min(fit_w, fit_h))
 
     def on_generate(self):
         # Reset visual y estado
         self.on_reset()
 
-        # Leer el tamaño y semilla del grid
+        # Leer el tamaño, inicio/meta y semilla del grid
         try:
-            n = int(self.size_spin.get())
+            rows = max(MIN_SIDE, int(self.rows_spin.get()))
+            cols = max(MIN_SIDE, int(self.cols_spin.get()))
         except Exception:
-            n = self.GRID_ROWS
-        self.GRID_ROWS = n
+            rows, cols = self.GRID_ROWS, self.GRID_COLS
+
+        if rows * cols > MAX_GUI_CELLS:
+            self.status_label.config(text=f"Error: {rows}x{cols} supera el máximo de {MAX_GUI_CELLS} celdas de la ventana; use bench.py para grids grandes.")
+            return
+        self.GRID_ROWS, self.GRID_COLS = rows, cols
+
+        try:
+            start = parse_cell(self.start_entry.get())
+            goal = parse_cell(self.goal_entry.get())
+            grid = Grid(rows, cols, start=start, goal=goal)
+        except ValueError as e:
+            self.status_label.config(text=f"Error en inicio/meta: {e}")
+            return
+        except MemoryError:
+            self.status_label.config(text=f"Error: no hay memoria para un grid de {rows}x{cols}.")
+            return
 
         seed_text = self.seed_entry.get().strip()
         seed_val: Optional[int] = None
@@ -398,13 +246,21 @@ class MainWindow(tk.Tk):
                 seed_val = abs(hash(seed_text)) & 0x7FFFFFFF
 
         # Crea el modelo
-        self.grid = Grid(self.GRID_ROWS)
+        self.grid = grid
 
-        # Dibuja el grid base
+        # Dibuja el grid base, con celdas ajustadas al tamaño nuevo (si el
+        # canvas aún no se muestra, lo ajusta el primer <Configure>)
+        width, height = self.canvas.winfo_width(), self.canvas.winfo_height()
+        if width > 1 and height > 1:
+            self._fit_cells(width, height)
         self.draw_grid()
 
-        # Obtener el generator del grid
-        self.gen = self.grid.recursive_backtracker(seed=seed_val, yield_events=True)
+        # Obtener el generator del grid, envuelto en una línea de tiempo navegable
+        events = self.grid.recursive_backtracker(seed=seed_val, yield_events=True)
+        events = TimedIterator(events, lambda: self.profiler)
+        self.timeline = Timeline(self.grid, events, KIND_MAZE, expected_length=2 * rows * cols + 1)
+        self.gen = self.timeline
+        self._sync_scrub()
         self.status_label.config(text=f"Generador listo. Semilla: {seed_text or 'None'}")
 
     def on_play(self):
@@ -425,27 +281,76 @@ class MainWindow(tk.Tk):
             self.playing = False
             return
 
+        prof = self.profiler
+        if prof is not None:
+            prof.begin_tick()
+
         try:
             for _ in range(self.BATCH_SIZE):
-                ev = next(self.gen)
-                self.process_event(ev)
+                if prof is None:
+                    ev = next(self.gen)
+                    self.process_event(ev)
+                else:
+                    # El generador original se mide aparte dentro de la timeline
+                    ev = prof.measure("timeline", next, self.gen)
+                    prof.measure("process_event", self.process_event, ev)
+            self._sync_scrub()
+            self._end_profile_tick()
             self._schedule_next()
 
         except StopIteration:
             self.playing = False
             self.gen = None
+            self._sync_scrub()
             self.status_label.config(text="Estado: Generador completado.")
+            self._end_profile_tick()
             self.after_id = None
 
+    def _end_profile_tick(self):
+        if self.profiler is not None:
+            self.profiler.end_tick()
+            self.profile_label.config(text=self.profiler.summary())
+
+    def enable_profiling(self):
+        # Los widgets se envuelven para cronometrar cada llamada a Tk
+        self.profiler = Profiler()
+        for name, widget in self._raw_widgets.items():
+            setattr(self, name, TimedWidget(widget, self.profiler, name))
+        self.profile_label.config(text=self.profiler.summary())
+
+    def disable_profiling(self):
+        self.profiler = None
+        for name, widget in self._raw_widgets.items():
+            setattr(self, name, widget)
+        self.profile_label.config(text="")
+
+    def on_toggle_profile(self):
+        if self.profile_var.get():
+            self.enable_profiling()
+        else:
+            self.disable_profiling()
+
+    def on_save_trace(self):
+        if self.profiler is None:
+            self.status_label.config(text="Error: Active el perfilado primero.")
+            return
+        path = filedialog.asksaveasfilename(defaultextension=".json", filetypes=[("Chrome trace", "*.json")])
+        if not path:
+            return
+        self.profiler.dump_trace(path)
+        self.status_label.config(text=f"Traza guardada en {path} ({self.profiler.span_count} spans)")
+
     def on_step(self):
         if self.gen is None or self.playing:
             return
         try:
             ev = next(self.gen)
             self.process_event(ev)
+            self._sync_scrub()
             self.status_label.config(text="Estado: Paso individual ejecutado.")
         except StopIteration:
             self.gen = None
+            self._sync_scrub()
             self.status_label.config(text="Estado: Generación completada (último paso).")
 
     def on_pause(self):
@@ -465,9 +370,20 @@ class MainWindow(tk.Tk):
         self.canvas.delete("all")
         self.draw_items = {}
         self.gen = None
+        self.timeline = None
         self.grid = None
+        self._sync_scrub()
 
     def on_run_bfs(self):
+        self._run_search(KIND_BFS)
+
+    def on_run_jps(self):
+        self._run_search(KIND_JPS)
+
+    def on_run_fill(self):
+        self._run_search(KIND_FILL)
+
+    def _run_search(self, kind: str):
         # Solo si hay grid ya generado (puede haber sido generado animado o ya terminado)
         if self.grid is None:
             self.status_label.config(text="Error: Genera primero el laberinto.")
@@ -477,12 +393,59 @@ class MainWindow(tk.Tk):
             self.status_label.config(text="Espera a que la generación termine o pausa primero.")
             return
 
-        # Obtener generator del BFS y arrancar la reproducción
-        self.gen = self.grid.bfs(self.grid.start, self.grid.goal, yield_events=True)
+        # Limpiar colores de una búsqueda anterior
+        self.draw_grid()
+
+        # Obtener generator de la búsqueda y arrancar la reproducción
+        cells = self.grid.rows * self.grid.cols
+        if kind == KIND_FILL:
+            events = deadend.events(self.grid, self.grid.start, self.grid.goal)
+        else:
+            search = self.grid.bfs if kind == KIND_BFS else self.grid.jps
+            events = search(self.grid.start, self.grid.goal, yield_events=True)
+        events = TimedIterator(events, lambda: self.profiler)
+        self.timeline = Timeline(self.grid, events, kind, expected_length=2 * cells + 1)
+        self.gen = self.timeline
+        self._sync_scrub()
         self.playing = True
-        self.status_label.config(text="BFS iniciado.")
+        self.status_label.config(text=f"{kind.upper()} iniciado.")
         self._schedule_next()
 
+    def on_scrub(self, val):
+        # Ignorar mientras se reproduce o cuando el valor ya coincide con el paso actual
+        if self.timeline is None or self.playing:
+            return
+        try:
+            target = int(float(val))
+        except ValueError:
+            return
+        if target == self.timeline.step:
+            return
+
+        step = self.timeline.seek(target)
+        done = self.timeline.finished and step >= self.timeline.length
+        self.gen = None if done else self.timeline
+
+        # Al arrastrar llegan muchos eventos: se redibuja una vez cuando Tk queda libre
+        if self._redraw_id is None:
+            self._redraw_id = self.after_idle(self._redraw_timeline)
+        self._sync_scrub()
+        self.status_label.config(text=f"Paso {step} / {self.timeline.horizon}")
+
+    def _redraw_timeline(self):
+        self._redraw_id = None
+        if self.timeline is not None:
+            self.draw_timeline_state()
+
+    def _sync_scrub(self):
+        # Ajusta el rango y la posición del slider a la línea de tiempo actual
+        if self.timeline is None:
+            self.scrub_slider.config(to=0)
+            self.scrub_slider.set(0)
+            return
+        self.scrub_slider.config(to=max(1, self.timeline.horizon))
+        self.scrub_slider.set(self.timeline.step)
+
     def cell_to_px(self, r: int, c: int):
         x0 = self.PADDING + c * self.CELL_PX
         y0 = self.PADDING + r * self.CELL_PX
@@ -490,16 +453,19 @@ class MainWindow(tk.Tk):
         y1 = y0 + self.CELL_PX
         return x0, y0, x1, y1
 
-    def draw_grid(self):
-        # Dibujar grid vacío o acorde a self.grid
+    def draw_grid(self, walls: Optional[bytearray] = None):
+        # Dibujar grid vacío o acorde a self.grid (o a las máscaras de muros dadas)
         self.canvas.delete("all")
         self.draw_items = {}
+        self._drawn_fills = self._drawn_walls = None
+
+        rows, cols = self._grid_shape()
 
         if self.grid is None:
 
-            for r in range(self.GRID_ROWS):
+            for r in range(rows):
 
-                for c in range(self.GRID_ROWS):
+                for c in range(cols):
 
                     x0, y0, x1, y1 = self.cell_to_px(r, c)
                     rect_id = self.canvas.create_rectangle(x0, y0, x1, y1, fill="white", outline="#ddd")
@@ -507,27 +473,30 @@ class MainWindow(tk.Tk):
 
             return
 
-        for r in range(self.GRID_ROWS):
-            for c in range(self.GRID_ROWS):
+        if walls is None:
+            walls = self.grid.walls
+
+        for r in range(rows):
+            for c in range(cols):
                 x0, y0, x1, y1 = self.cell_to_px(r, c)
                 rect_id = self.canvas.create_rectangle(x0, y0, x1, y1, fill="white", outline="")
                 self.draw_items[f"cell-{r}-{c}-bg"] = rect_id
 
-                cell = self.grid.cells[(r, c)]
+                mask = walls[r * cols + c]
                 # dibujar muros si existen
-                if cell.get("wall_up", True):
+                if mask & WALL_UP:
                     lid = self.canvas.create_line(x0, y0, x1, y0, width=2)
                     self.draw_items[f"wall-{r}-{c}-up"] = lid
 
-                if cell.get("wall_down", True):
+                if mask & WALL_DOWN:
                     lid = self.canvas.create_line(x0, y1, x1, y1, width=2)
                     self.draw_items[f"wall-{r}-{c}-down"] = lid
 
-                if cell.get("wall_left", True):
+                if mask & WALL_LEFT:
                     lid = self.canvas.create_line(x0, y0, x0, y1, width=2)
                     self.draw_items[f"wall-{r}-{c}-left"] = lid
 
-                if cell.get("wall_right", True):
+                if mask & WALL_RIGHT:
                     lid = self.canvas.create_line(x1, y0, x1, y1, width=2)
                     self.draw_items[f"wall-{r}-{c}-right"] = lid
 
@@ -544,6 +513,75 @@ class MainWindow(tk.Tk):
             if f"cell-{gr}-{gc}-bg" in self.draw_items:
                 self.canvas.itemconfigure(self.draw_items[f"cell-{gr}-{gc}-bg"], fill="#ff3f3f")
 
+        self._drawn_walls = bytearray(walls)
+        self._drawn_fills = self._base_fills()
+
+    def _base_fills(self) -> List[str]:
+        # Colores de fondo por celda (índice r * cols + c) recién dibujado el grid
+        cols = self.grid.cols
+        fills = ["white"] * (self.grid.rows * cols)
+        fills[self.grid.start[0] * cols + self.grid.start[1]] = "#58fc70"
+        fills[self.grid.goal[0] * cols + self.grid.goal[1]] = "#ff3f3f"
+        return fills
+
+    def draw_timeline_state(self, rebuild: bool = False):
+        """
+        Pinta el estado en la posición actual de la línea de tiempo. Reusa los
+        items del canvas: solo cambia el relleno de las celdas y la
+        visibilidad de los muros que difieren de lo ya pintado. Con rebuild
+        (p. ej. al cambiar el tamaño de la ventana) crea los items de nuevo.
+        """
+        tl = self.timeline
+        if rebuild:
+            # El laberinto necesita todos los muros creados para poder volver atrás
+            if tl.kind == KIND_MAZE:
+                self.draw_grid(bytearray([ALL_WALLS]) * len(tl.walls))
+            else:
+                self.draw_grid(tl.walls)
+
+        cols = tl.cols
+        n = len(tl.visited)
+        drawn_fills = self._drawn_fills or [None] * n
+        drawn_walls = self._drawn_walls
+
+        # Colores equivalentes a los de process_event
+        if tl.kind == KIND_MAZE:
+            done_color, pending_color = "#f6f6f6", "#e8f8e8"
+        elif tl.kind == KIND_FILL:
+            done_color, pending_color = "#c8c8c8", "#c8c8c8"
+        else:
+            done_color, pending_color = "#8cd3ff", "#ffe38a"
+
+        fills = self._base_fills()
+        pending = set(tl.container)
+        for i, seen in enumerate(tl.visited):
+            if seen:
+                fills[i] = pending_color if i in pending else done_color
+        for r, c in tl.path:
+            fills[r * cols + c] = "#ffb86b"
+
+        for i, color in enumerate(fills):
+            if drawn_fills[i] != color:
+                r, c = divmod(i, cols)
+                k = f"cell-{r}-{c}-bg"
+                if k in self.draw_items:
+                    self.canvas.itemconfigure(self.draw_items[k], fill=color)
+
+        # Muros: mostrar u ocultar los que cambiaron (solo el laberinto los mueve)
+        walls = tl.walls
+        for i in range(n):
+            changed = ALL_WALLS if drawn_walls is None else drawn_walls[i] ^ walls[i]
+            if not changed & ALL_WALLS:
+                continue
+            r, c = divmod(i, cols)
+            for bit, side in ((WALL_UP, "up"), (WALL_DOWN, "down"), (WALL_LEFT, "left"), (WALL_RIGHT, "right")):
+                k = f"wall-{r}-{c}-{side}"
+                if changed & bit and k in self.draw_items:
+                    self.canvas.itemconfigure(self.draw_items[k], state="normal" if walls[i] & bit else "hidden")
+
+        self._drawn_fills = fills
+        self._drawn_walls = bytearray(walls)
+
     def remove_wall_visual(self, a: Cell, b: Cell):
         # Oculta el muro correspondiente entre a y b
         ar, ac = a
@@ -560,11 +598,8 @@ class MainWindow(tk.Tk):
 
                     if k in self.draw_items:
 
-                        try:
-                            self.canvas.delete(self.draw_items[k])
-                        except Exception:
-                            pass
-                        del self.draw_items[k]
+                        # Se oculta (no se borra) para poder volver atrás con el slider
+                        self.canvas.itemconfigure(self.draw_items[k], state="hidden")
 
             elif ac - 1 == bc:
 
@@ -575,11 +610,8 @@ class MainWindow(tk.Tk):
 
                     if k in self.draw_items:
 
-                        try:
-                            self.canvas.delete(self.draw_items[k])
-                        except Exception:
-                            pass
-                        del self.draw_items[k]
+                        # Se oculta (no se borra) para poder volver atrás con el slider
+                        self.canvas.itemconfigure(self.draw_items[k], state="hidden")
 
         elif ac == bc:
 
@@ -592,11 +624,8 @@ class MainWindow(tk.Tk):
 
                     if k in self.draw_items:
 
-                        try:
-                            self.canvas.delete(self.draw_items[k])
-                        except Exception:
-                            pass
-                        del self.draw_items[k]
+                        # Se oculta (no se borra) para poder volver atrás con el slider
+                        self.canvas.itemconfigure(self.draw_items[k], state="hidden")
 
             elif ar - 1 == br:
 
@@ -607,15 +636,15 @@ class MainWindow(tk.Tk):
 
                     if k in self.draw_items:
 
-                        try:
-                            self.canvas.delete(self.draw_items[k])
-                        except Exception:
-                            pass
-                        del self.draw_items[k]
+                        # Se oculta (no se borra) para poder volver atrás con el slider
+                        self.canvas.itemconfigure(self.draw_items[k], state="hidden")
 
     def process_event(self, event: Dict):
         ev_type = event.get("event")
 
+        # El canvas cambia por fuera de draw_timeline_state
+        self._drawn_fills = self._drawn_walls = None
+
         # Eventos del laberinto
         if ev_type == "start" and "from" not in event and "cell" in event and "enqueue" not in event:
 
@@ -700,6 +729,16 @@ class MainWindow(tk.Tk):
             self.status_label.config(text=f"Dequeue {cell} q={event.get('queue_size')}")
             return
 
+        # FILL (relleno de callejones)
+        if ev_type == "fill":
+            cell = event.get("cell")
+            if cell:
+                k = f"cell-{cell[0]}-{cell[1]}-bg"
+                if k in self.draw_items:
+                    self.canvas.itemconfigure(self.draw_items[k], fill="#c8c8c8")  # filled color
+            self.status_label.config(text=f"Fill {cell} filled={event.get('filled_count')}")
+            return
+
         # VISIT
         if ev_type == "visit":
             cell = event.get("cell")
@@ -744,14 +783,15 @@ class MainWindow(tk.Tk):
             k = f"cell-{cell[0]}-{cell[1]}-bg"
             if k in self.draw_items:
                 self.canvas.itemconfigure(self.draw_items[k], fill="#ffb86b")
+                self._drawn_fills = None
             # programar siguiente
             self.after(step_ms, lambda: paint_step(idx + 1))
 
         paint_step(0)
 
 def main():
-    n = menu()
-    grid = Grid(n)
+    rows, cols = menu()
+    grid = Grid(rows, cols)
 
     generar = grid.recursive_backtracker(seed=1234, yield_events=True)
     #print(generar)
@@ -796,7 +836,7 @@ def main():
     print("Test complete.")
     '''
 
-    app = MainWindow(n)
+    app = MainWindow(rows, cols)
     app.mainloop()
         
 main()
@@ -0,0 +1,222 @@
+'''
+
+Perfilado del loop de animación: tiempos por tick y trazas para flamegraph
+
+Creado por Fabián Hevia
+
+'''
+
+import json
+import math
+import time
+from array import array
+from collections import deque
+from typing import Callable, Deque, Dict, Iterator, List, Optional, Tuple
+
+# (total, generador, timeline sin generador, dispatch sin Tk, Tk) en nanosegundos
+Sample = Tuple[int, int, int, int, int]
+
+# Columnas de las muestras, en el mismo orden que Sample
+COLUMNS = ("tick", "generator", "timeline", "dispatch", "tk")
+
+
+class Profiler:
+    """
+    Mide cada tick de `MainWindow._batch_consume` separando el tiempo del
+    generador de eventos, el de la contabilidad de la `Timeline` que lo
+    envuelve, el dispatch de `process_event` y las llamadas a widgets de Tk
+    (canvas, barra de estado y slider; ver `TimedWidget`).
+    Guarda los últimos `window` ticks para percentiles y, a la vez, spans en
+    formato Chrome trace-event (chrome://tracing, Perfetto).
+    """
+
+    def __init__(self, window: int = 300, max_trace_events: int = 1_000_000):
+        self.samples: Deque[Sample] = deque(maxlen=window)
+        self.max_trace_events = max_trace_events
+        self.dropped = 0
+
+        # Spans como ternas planas (tipo, inicio, fin) en nanosegundos, donde
+        # tipo indexa _span_kinds = [(nombre, categoría)]. Sin un objeto por
+        # span: 24 bytes cada uno y nada que recorra el GC. Se pasan a dicts
+        # de trace-event solo en dump_trace.
+        self._trace = array("q")
+        self._span_kinds: List[Tuple[str, str]] = []
+        self._kind_ids: Dict[Tuple[str, str], int] = {}
+
+        self._origin = time.perf_counter_ns()
+        self._in_tick = False
+        self._tick_start = 0
+        self._dispatching = False
+        self._tk_in_dispatch = 0
+        self._ns = dict.fromkeys(("generator", "timeline", "process_event", "tk"), 0)
+
+    # Ticks
+    def begin_tick(self) -> None:
+        self._in_tick = True
+        for part in self._ns:
+            self._ns[part] = 0
+        self._tk_in_dispatch = 0
+        self._tick_start = time.perf_counter_ns()
+
+    def end_tick(self) -> None:
+        end = time.perf_counter_ns()
+        self._in_tick = False
+        self._span("tick", "tick", self._tick_start, end)
+
+        # El generador corre dentro de la timeline y las llamadas a Tk de
+        # process_event se descuentan del dispatch (las demás, como el slider,
+        # quedan solo en la columna tk)
+        ns = self._ns
+        self.samples.append((
+            end - self._tick_start,
+            ns["generator"],
+            ns["timeline"] - ns["generator"],
+            ns["process_event"] - self._tk_in_dispatch,
+            ns["tk"],
+        ))
+
+    def measure(self, part: str, fn: Callable, *args):
+        """
+        Ejecuta fn(*args) cronometrado como "generator", "timeline" o
+        "process_event". Fuera de un tick solo lo ejecuta.
+        """
+        if not self._in_tick:
+            return fn(*args)
+
+        dispatching = self._dispatching
+        self._dispatching = dispatching or part == "process_event"
+        t0 = time.perf_counter_ns()
+        try:
+            return fn(*args)
+        finally:
+            t1 = time.perf_counter_ns()
+            self._dispatching = dispatching
+            self._ns[part] += t1 - t0
+            self._span(part, part, t0, t1)
+
+    def record_tk(self, name: str, t0: int, t1: int) -> None:
+        # Solo cuenta dentro de un tick (redibujos completos quedan fuera)
+        if not self._in_tick:
+            return
+        self._ns["tk"] += t1 - t0
+        if self._dispatching:
+            self._tk_in_dispatch += t1 - t0
+        self._span(name, "tk", t0, t1)
+
+    # Resultados
+    def percentiles(self, ps: Tuple[int, ...] = (50, 95, 99)) -> Dict[str, Dict[int, float]]:
+        """Percentiles en milisegundos de cada parte sobre la ventana móvil."""
+        result = {}
+        for k, name in enumerate(COLUMNS):
+            values = sorted(s[k] for s in self.samples)
+            result[name] = {p: _percentile(values, p) / 1e6 for p in ps}
+        return result
+
+    def summary(self) -> str:
+        if not self.samples:
+            return "Perfil: sin datos"
+        pct = self.percentiles()
+        parts = [f"{name} {v[50]:.2f}/{v[95]:.2f}/{v[99]:.2f}" for name, v in pct.items()]
+        return "p50/p95/p99 ms  " + "  ".join(parts)
+
+    @property
+    def span_count(self) -> int:
+        return len(self._trace) // 3
+
+    def dump_trace(self, path: str) -> None:
+        """
+        Guarda los spans como JSON de Chrome trace-event. Los eventos se
+        escriben de a uno para no armar todos los dicts en memoria.
+        """
+        origin = self._origin
+        trace = self._trace
+
+        with open(path, "w", encoding="utf-8") as f:
+            f.write('{"traceEvents": [')
+            for k in range(0, len(trace), 3):
+                name, cat = self._span_kinds[trace[k]]
+                t0, t1 = trace[k + 1], trace[k + 2]
+                if k:
+                    f.write(",")
+                json.dump({
+                    "name": name,
+                    "cat": cat,
+                    "ph": "X",
+                    "ts": (t0 - origin) / 1000,
+                    "dur": (t1 - t0) / 1000,
+                    "pid": 1,
+                    "tid": 1,
+                }, f)
+            f.write('], "displayTimeUnit": "ms", ')
+            f.write(f'"otherData": {json.dumps({"dropped_events": self.dropped})}}}')
+
+    # Internos
+    def _span(self, name: str, cat: str, t0: int, t1: int) -> None:
+        if len(self._trace) >= 3 * self.max_trace_events:
+            self.dropped += 1
+            return
+
+        kind = self._kind_ids.get((name, cat))
+        if kind is None:
+            kind = self._kind_ids[(name, cat)] = len(self._span_kinds)
+            self._span_kinds.append((name, cat))
+        self._trace.extend((kind, t0, t1))
+
+
+class TimedWidget:
+    """
+    Proxy sobre un widget de Tk (canvas, label, scale) que cronometra cada
+    método llamado y lo reporta al Profiler como "<label>.<método>". Los
+    atributos que no son métodos pasan tal cual.
+    """
+
+    def __init__(self, widget, profiler: Profiler, label: str):
+        self._widget = widget
+        self._profiler = profiler
+        self._label = label
+
+    def __getattr__(self, name: str):
+        attr = getattr(self._widget, name)
+        if not callable(attr):
+            return attr
+
+        profiler = self._profiler
+        span = f"{self._label}.{name}"
+
+        def timed(*args, **kwargs):
+            t0 = time.perf_counter_ns()
+            try:
+                return attr(*args, **kwargs)
+            finally:
+                profiler.record_tk(span, t0, time.perf_counter_ns())
+
+        return timed
+
+
+class TimedIterator:
+    """
+    Envuelve el generador de eventos que consume la Timeline para que cada
+    `next` se cuente como "generator". El profiler se consulta en cada paso
+    con `get_profiler`, así que se puede activar o desactivar en caliente.
+    """
+
+    def __init__(self, iterator: Iterator, get_profiler: Callable[[], Optional[Profiler]]):
+        self._iterator = iterator
+        self._get_profiler = get_profiler
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        profiler = self._get_profiler()
+        if profiler is None:
+            return next(self._iterator)
+        return profiler.measure("generator", next, self._iterator)
+
+
+def _percentile(values: List[int], p: int) -> float:
+    # Percentil por rango más cercano sobre una lista ya ordenada
+    if not values:
+        return 0.0
+    k = max(0, min(len(values) - 1, math.ceil(p / 100 * len(values)) - 1))
+    return float(values[k])
@@ -0,0 +1,161 @@
+'''
+
+Exportación de laberintos a imagen (PNG/PPM) sin Tk
+
+Creado por Fabián Hevia
+
+'''
+
+import struct
+import zlib
+from typing import Iterable, Optional, Tuple, Union
+
+from grid import Grid, Cell, WALL_DOWN, WALL_RIGHT
+
+# Colores RGB, los mismos que usa MainWindow
+WALL = (0, 0, 0)
+BACKGROUND = (255, 255, 255)
+VISITED = (0x8c, 0xd3, 0xff)
+FRONTIER = (0xff, 0xe3, 0x8a)
+PATH = (0xff, 0xb8, 0x6b)
+START = (0x58, 0xfc, 0x70)
+GOAL = (0xff, 0x3f, 0x3f)
+
+# Índices de paleta (a mayor índice, mayor prioridad al pintar)
+_PALETTE = (BACKGROUND, VISITED, FRONTIER, PATH, START, GOAL)
+_BG, _VISITED, _FRONTIER, _PATH, _START, _GOAL = range(6)
+
+# Una capa puede ser un bitmap (como Timeline.visited), celdas sueltas o
+# índices r * cols + c (como Timeline.container)
+Layer = Union[bytes, bytearray, Iterable[Cell], Iterable[int]]
+
+# Tablas de bytes.translate: 0 -> 0 / distinto de 0 -> 1, y el inverso en 0xFF
+_NONZERO = bytes([0]) + bytes([1]) * 255
+_KEEP = bytes([0xFF]) + bytes(255)
+
+# Bits por celda para armar pixeles: muro (2) o vecino del mismo color (1)
+_WALL_RIGHT_BIT = bytes(2 if m & WALL_RIGHT else 0 for m in range(256))
+_WALL_DOWN_BIT = bytes(2 if m & WALL_DOWN else 0 for m in range(256))
+_TIMES4 = bytes((k * 4) & 0xFF for k in range(256))
+
+
+def _bytewise(op, a: bytes, b: bytes) -> bytes:
+    # AND/OR/XOR byte a byte de dos strings del mismo largo, en bloque con ints
+    n = len(a)
+    return op(int.from_bytes(a, "big"), int.from_bytes(b, "big")).to_bytes(n, "big")
+
+
+def _paint(colors: bytearray, layer: Optional[Layer], value: int, cols: int) -> bytearray:
+    if layer is None:
+        return colors
+    if isinstance(layer, (bytes, bytearray)):
+        # colors = layer ? value : colors, sin recorrer celda por celda
+        on = layer.translate(_NONZERO)
+        keep = _bytewise(int.__and__, colors, layer.translate(_KEEP))
+        painted = on.translate(bytes([0, value]) + bytes(254))
+        return bytearray(_bytewise(int.__or__, keep, painted))
+    for cell in layer:
+        if isinstance(cell, int):
+            colors[cell] = value
+        else:
+            colors[cell[0] * cols + cell[1]] = value
+    return colors
+
+
+def render(grid: Grid, cell_px: int = 4, walls: Optional[bytearray] = None,
+           visited: Optional[Layer] = None, frontier: Optional[Layer] = None,
+           path: Optional[Iterable[Cell]] = None) -> Tuple[int, int, bytes]:
+    """
+    Dibuja el grid como RGB de 8 bits. Retorna (ancho, alto, pixeles).
+
+    Cada celda ocupa `cell_px` pixeles y los muros son líneas de 1 px sobre
+    los bordes. Todo se calcula en bloque sobre el grid completo: cada celda
+    recibe un código (color, muro, vecino del mismo color) con operaciones
+    byte a byte, y cada fila de pixeles se arma mapeando esos códigos a
+    tramos precalculados, una fila de pixeles por fila de celdas repetida
+    para todo su interior.
+    """
+    if cell_px < 2:
+        raise ValueError("cell_px debe ser >= 2")
+
+    rows, cols = grid.rows, grid.cols
+    n = rows * cols
+    if walls is None:
+        walls = grid.walls
+    walls = bytes(walls[:n])
+
+    colors = bytearray(n)
+    colors = _paint(colors, visited, _VISITED, cols)
+    colors = _paint(colors, frontier, _FRONTIER, cols)
+    colors = _paint(colors, path, _PATH, cols)
+    colors[grid.start[0] * cols + grid.start[1]] = _START
+    colors[grid.goal[0] * cols + grid.goal[1]] = _GOAL
+    colors = bytes(colors)
+
+    inner = cell_px - 1
+    wall_px = bytes(WALL)
+    fills = [bytes(rgb) * inner for rgb in _PALETTE]
+    pixels = [bytes(rgb) for rgb in _PALETTE]
+    border_row = wall_px * (cols * cell_px + 1)
+    base = colors.translate(_TIMES4)
+
+    # Interior: color de la celda y luego el muro derecho, o el hueco (del
+    # color de la celda si la vecina de la derecha comparte color)
+    right_same = _bytewise(int.__xor__, colors, colors[1:] + b"\xff").translate(_KEEP).translate(_NONZERO)
+    right = _bytewise(int.__or__, base, _bytewise(int.__or__, walls.translate(_WALL_RIGHT_BIT), right_same))
+    right_units = [fills[k] + (wall_px if sep & 2 else pixels[k] if sep & 1 else pixels[_BG])
+                   for k in range(len(_PALETTE)) for sep in range(4)]
+
+    # Línea inferior: muro, o hueco del color de la celda si la de abajo comparte color
+    below_same = _bytewise(int.__xor__, colors, colors[cols:] + b"\xff" * cols).translate(_KEEP).translate(_NONZERO)
+    below = _bytewise(int.__or__, base, _bytewise(int.__or__, walls.translate(_WALL_DOWN_BIT), below_same))
+    below_units = [(wall_px * inner if sep & 2 else fills[k] if sep & 1 else fills[_BG]) + wall_px
+                   for k in range(len(_PALETTE)) for sep in range(4)]
+
+    out = [border_row]
+    for r in range(rows):
+        start = r * cols
+        interior = wall_px + b"".join(map(right_units.__getitem__, right[start:start + cols]))
+        out.extend([interior] * inner)
+
+        if r == rows - 1:
+            out.append(border_row)
+        else:
+            out.append(wall_px + b"".join(map(below_units.__getitem__, below[start:start + cols])))
+
+    return cols * cell_px + 1, rows * cell_px + 1, b"".join(out)
+
+
+def write_ppm(filename: str, width: int, height: int, rgb: bytes) -> None:
+    with open(filename, "wb") as f:
+        f.write(b"P6\n%d %d\n255\n" % (width, height))
+        f.write(rgb)
+
+
+def write_png(filename: str, width: int, height: int, rgb: bytes) -> None:
+    def chunk(tag: bytes, data: bytes) -> bytes:
+        return struct.pack(">I", len(data)) + tag + data + struct.pack(">I", zlib.crc32(tag + data))
+
+    # Cada scanline va precedida del filtro 0 (None)
+    stride = width * 3
+    raw = b"".join(b"\x00" + rgb[y * stride:(y + 1) * stride] for y in range(height))
+
+    with open(filename, "wb") as f:
+        f.write(b"\x89PNG\r\n\x1a\n")
+        f.write(chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)))
+        f.write(chunk(b"IDAT", zlib.compress(raw, 6)))
+        f.write(chunk(b"IEND", b""))
+
+
+def export(grid: Grid, filename: str, cell_px: int = 4, walls: Optional[bytearray] = None,
+           visited: Optional[Layer] = None, frontier: Optional[Layer] = None,
+           path: Optional[Iterable[Cell]] = None) -> None:
+    """Renderiza y guarda como PNG o PPM según la extensión del archivo."""
+    width, height, rgb = render(grid, cell_px, walls, visited, frontier, path)
+
+    if filename.lower().endswith(".ppm"):
+        write_ppm(filename, width, height, rgb)
+    elif filename.lower().endswith(".png"):
+        write_png(filename, width, height, rgb)
+    else:
+        raise ValueError(f"Formato no soportado: {filename} (use .png o .ppm)")
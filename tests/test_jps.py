@@ -0,0 +1,78 @@
+'''
+
+Pruebas de Jump Point Search contra BFS (largo del camino óptimo)
+
+Creado por Fabián Hevia
+
+'''
+
+import random
+
+import pytest
+
+from grid import Grid
+
+
+def _random_rooms(n: int, p: float, rng: random.Random) -> Grid:
+    # Quita cada muro con probabilidad p (p alto = grandes zonas abiertas)
+    grid = Grid(n)
+    for r in range(n):
+        for c in range(n):
+            for nb in grid.neighbors(r, c):
+                if rng.random() < p:
+                    grid.remove_wall((r, c), nb)
+    return grid
+
+
+def _final_path(events):
+    *_, done = events
+    return done["path"]
+
+
+def _is_walkable(grid: Grid, path) -> bool:
+    return all(b in grid.neighbors_open(*a) for a, b in zip(path, path[1:]))
+
+
+@pytest.mark.parametrize("layout", ["maze", "braid", "rooms", "sparse"])
+def test_jps_path_length_matches_bfs(layout):
+    rng = random.Random(layout)
+
+    for trial in range(60):
+        n = rng.randint(2, 24)
+        if layout in ("maze", "braid"):
+            grid = Grid(n)
+            grid.recursive_backtracker(seed=trial)
+            if layout == "braid":
+                grid.braid(rng.random(), seed=trial)
+        else:
+            grid = _random_rooms(n, 0.9 if layout == "rooms" else 0.4, rng)
+
+        start = (rng.randrange(n), rng.randrange(n))
+        goal = (rng.randrange(n), rng.randrange(n))
+        bfs_path = _final_path(grid.bfs(start, goal, yield_events=True))
+        jps_path = _final_path(grid.jps(start, goal, yield_events=True))
+
+        assert len(jps_path) == len(bfs_path), (layout, trial, start, goal)
+        if jps_path:
+            assert jps_path[0] == start and jps_path[-1] == goal
+            assert _is_walkable(grid, jps_path)
+
+
+def test_jps_unreachable_goal_gives_empty_path():
+    grid = Grid(4, 6)
+    grid.remove_wall((0, 0), (0, 1))
+
+    assert _final_path(grid.jps((0, 0), (3, 5), yield_events=True)) == []
+    assert _final_path(grid.bfs((0, 0), (3, 5), yield_events=True)) == []
+
+
+def test_jps_rectangular_grid_open_field():
+    grid = Grid(7, 31)
+    for r in range(7):
+        for c in range(31):
+            for nb in grid.neighbors(r, c):
+                grid.remove_wall((r, c), nb)
+
+    path = _final_path(grid.jps((6, 0), (0, 30), yield_events=True))
+    assert len(path) == 6 + 30 + 1
+    assert _is_walkable(grid, path)
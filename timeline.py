@@ -0,0 +1,232 @@
+'''
+
+Línea de tiempo navegable para los generadores de eventos del grid
+
+Creado por Fabián Hevia
+
+'''
+
+from array import array
+from collections import deque
+from typing import List, Iterator, Optional, Tuple, Union
+
+from grid import Grid, Cell, Event, WALL_UP, WALL_DOWN, WALL_LEFT, WALL_RIGHT
+
+# Tipos de línea de tiempo soportados
+KIND_MAZE = "maze"
+KIND_BFS = "bfs"
+KIND_JPS = "jps"
+KIND_FILL = "fill"
+
+# Snapshot: (muros, bitmap de visitados, stack o queue como índices). Los muros
+# solo se copian en el laberinto; en las búsquedas no cambian (b"").
+Checkpoint = Tuple[bytes, bytes, array]
+
+# K automático: un snapshot cuesta ~6 bytes por celda (muros + visitados + stack/queue),
+# así que con K >= celdas / 8 el total de snapshots queda en O(eventos).
+MIN_CHECKPOINT_EVERY = 1000
+CELLS_PER_CHECKPOINT_EVENT = 8
+
+
+class Timeline:
+    """
+    Envuelve el generador de eventos de `recursive_backtracker`, `bfs`, `jps`
+    o `deadend.events` y permite moverse a cualquier paso, también hacia atrás.
+    En el relleno de callejones, `visited` marca las celdas rellenadas.
+
+    Cada `checkpoint_every` (K) eventos guarda un snapshot de muros (solo en
+    el laberinto), visitados y stack/queue. Para ir al paso k se restaura el
+    snapshot anterior más cercano (una copia de O(celdas) bytes) y se
+    re-aplican como mucho K eventos; como K crece con el tamaño del grid,
+    eso es O(K).
+
+    `container` guarda índices r * cols + c: un array para el stack del
+    laberinto y un deque para la cola de las búsquedas.
+
+    Es un iterador: `next(timeline)` avanza un paso y devuelve el evento, de
+    modo que puede reemplazar directamente al generador en `MainWindow`.
+    """
+
+    def __init__(self, grid: Grid, events: Iterator[Event], kind: str,
+                 checkpoint_every: Optional[int] = None, expected_length: int = 0):
+
+        if kind not in (KIND_MAZE, KIND_BFS, KIND_JPS, KIND_FILL):
+            raise ValueError(f"Tipo de línea de tiempo desconocido: {kind}")
+        self.rows = grid.rows
+        self.cols = grid.cols
+        cells = self.rows * self.cols
+
+        if checkpoint_every is None:
+            checkpoint_every = max(MIN_CHECKPOINT_EVERY, cells // CELLS_PER_CHECKPOINT_EVENT)
+        if checkpoint_every < 1:
+            raise ValueError("checkpoint_every debe ser >= 1")
+
+        self.kind = kind
+        self.checkpoint_every = checkpoint_every
+        self.expected_length = expected_length
+
+        self._source: Optional[Iterator[Event]] = events
+        self._events: List[Event] = []
+        self._checkpoints: List[Checkpoint] = []
+
+        # Estado reconstruido en la posición actual (self.step). Los muros se
+        # copian una sola vez y solo el laberinto los modifica.
+        self.step = 0
+        self.walls = grid.wall_masks()
+        self.visited = bytearray(cells)
+        self.container: Union[array, deque] = array("i") if kind == KIND_MAZE else deque()
+
+        self._checkpoints.append(self._snapshot())
+
+    # Propiedades
+    @property
+    def length(self) -> int:
+        """Cantidad de eventos conocidos hasta ahora."""
+        return len(self._events)
+
+    @property
+    def finished(self) -> bool:
+        """True cuando el generador original ya se agotó."""
+        return self._source is None
+
+    @property
+    def horizon(self) -> int:
+        """Último paso alcanzable (usa expected_length mientras no termine)."""
+        if self.finished:
+            return self.length
+        return max(self.length, self.expected_length)
+
+    @property
+    def path(self) -> List[Cell]:
+        """Camino del evento "done" si la línea de tiempo está parada sobre él."""
+        if self.step > 0:
+            ev = self._events[self.step - 1]
+            if ev.get("event") == "done":
+                return ev.get("path", [])
+        return []
+
+    # Iterador
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> Event:
+        if self.step >= len(self._events) and not self._pull():
+            raise StopIteration
+        return self._advance()
+
+    def seek(self, step: int) -> int:
+        """
+        Mueve la línea de tiempo al paso indicado (cantidad de eventos
+        aplicados). Si el paso aún no se ha generado, consume el generador
+        hasta alcanzarlo. Retorna el paso efectivo.
+        """
+        step = max(0, step)
+
+        while step > len(self._events) and self._pull():
+            pass
+        step = min(step, len(self._events))
+
+        # Si el destino está en el mismo tramo y adelante, basta con avanzar
+        k = self.checkpoint_every
+        if not (self.step <= step and self.step // k == step // k):
+            self._restore(step // k)
+
+        while self.step < step:
+            self._advance()
+
+        return self.step
+
+    # Internos
+    def _pull(self) -> bool:
+        """Trae un evento nuevo del generador original. Retorna False al agotarse."""
+        if self._source is None:
+            return False
+        try:
+            ev = next(self._source)
+        except StopIteration:
+            self._source = None
+            return False
+
+        self._events.append(ev)
+        return True
+
+    def _advance(self) -> Event:
+        """Aplica el evento en la posición actual y guarda snapshot si corresponde."""
+        ev = self._events[self.step]
+        self._apply(ev)
+        self.step += 1
+
+        # Snapshot la primera vez que el cursor llega a un múltiplo de K
+        k = self.checkpoint_every
+        if self.step % k == 0 and self.step // k == len(self._checkpoints):
+            self._checkpoints.append(self._snapshot())
+        return ev
+
+    def _snapshot(self) -> Checkpoint:
+        if self.kind == KIND_MAZE:
+            return bytes(self.walls), bytes(self.visited), self.container[:]
+        return b"", bytes(self.visited), array("i", self.container)
+
+    def _restore(self, checkpoint: int) -> None:
+        checkpoint = min(checkpoint, len(self._checkpoints) - 1)
+        walls, visited, idx = self._checkpoints[checkpoint]
+
+        if self.kind == KIND_MAZE:
+            self.walls[:] = walls
+            self.container = idx[:]
+        else:
+            self.container = deque(idx)
+
+        self.visited[:] = visited
+        self.step = checkpoint * self.checkpoint_every
+
+    def _apply(self, ev: Event) -> None:
+        et = ev.get("event")
+        cols = self.cols
+
+        if et == "start" and self.kind != KIND_FILL:
+            r, c = ev["cell"]
+            self.visited[r * cols + c] = 1
+            self.container.append(r * cols + c)
+
+        elif et == "carve":
+            ia, ib, wa, wb = self._carve_bits(ev["from"], ev["to"])
+            self.walls[ia] &= ~wa
+            self.walls[ib] &= ~wb
+            self.visited[ib] = 1
+            self.container.append(ib)
+
+        elif et == "backtrack":
+            self.container.pop()
+
+        elif et == "expand":
+            # BFS saca en orden FIFO; JPS saca de un heap, así que se quita la celda exacta
+            if self.kind == KIND_BFS:
+                self.container.popleft()
+            else:
+                r, c = ev["cell"]
+                self.container.remove(r * cols + c)
+
+        elif et == "discover":
+            r, c = ev["to"]
+            self.visited[r * cols + c] = 1
+            self.container.append(r * cols + c)
+
+        elif et == "fill":
+            r, c = ev["cell"]
+            self.visited[r * cols + c] = 1
+
+    def _carve_bits(self, a: Cell, b: Cell) -> Tuple[int, int, int, int]:
+        """Índices de a y b y el bit del muro que comparten en cada uno."""
+        (ar, ac), (br, bc) = a, b
+        cols = self.cols
+        ia = ar * cols + ac
+        ib = br * cols + bc
+
+        if ar == br and ac + 1 == bc:
+            return ia, ib, WALL_RIGHT, WALL_LEFT
+        if ar == br and ac - 1 == bc:
+            return ia, ib, WALL_LEFT, WALL_RIGHT
+        if ac == bc and ar + 1 == br:
+            return ia, ib, WALL_DOWN, WALL_UP
+        return ia, ib, WALL_UP, WALL_DOWN